@@ -1,16 +1,20 @@
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Dict, Any
 
 router = APIRouter()
 
 # Request models
 class SignUpRequest(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
     username: str
     email: str
     password: str
 
 class SignInRequest(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
     email: str
     password: str
 
@@ -1,12 +1,8 @@
 # api/routes_exam_generation.py
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+import asyncio
 import os
 import uuid
-import sys
-from pathlib import Path
-
-# Add services to path
-sys.path.append(str(Path(__file__).parent.parent / "services"))
 
 try:
     from services.exam_service import exam_service
@@ -48,13 +44,14 @@ async def generate_exam_from_pdf(
         unique_filename = f"{uuid.uuid4()}{file_extension}"
         pdf_path = os.path.join(temp_dir, unique_filename)
         
-        # Save uploaded file
+        # Save uploaded file in 1 MiB chunks instead of reading it whole
         with open(pdf_path, "wb") as f:
-            content = await pdf_file.read()
-            f.write(content)
+            while chunk := await pdf_file.read(1 << 20):
+                f.write(chunk)
         
-        # Generate exam
-        result = exam_service.generate_exam_from_pdf(
+        # Generate exam (blocking PDF parsing and Gemini calls run in a thread)
+        result = await asyncio.to_thread(
+            exam_service.generate_exam_from_pdf,
             pdf_path=pdf_path,
             query=query,
             mcq_count=mcq_count,
@@ -113,7 +110,8 @@ async def test_exam_generation():
                 "note": "Place a sample.pdf file in the root directory for testing"
             }
         
-        result = exam_service.generate_exam_from_pdf(
+        result = await asyncio.to_thread(
+            exam_service.generate_exam_from_pdf,
             pdf_path=sample_pdf_path,
             query="artificial intelligence and machine learning",
             mcq_count=5,
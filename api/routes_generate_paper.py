@@ -1,20 +1,17 @@
 # api/routes_generate_paper.py
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from fastapi.responses import JSONResponse, StreamingResponse
-from pydantic import BaseModel
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from pathlib import Path
-import shutil
 from datetime import datetime
+import asyncio
 import io
+import msgspec
 import re
 import random
-import sys
 import os
 
-# Add the current directory to Python path to find your modules
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 router = APIRouter()
 
 # Folder to save uploaded files
@@ -26,6 +23,8 @@ MAX_FILES = 10
 
 # Pydantic Model for Download Paper
 class DownloadPaperRequest(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
     id: int
     title: str
     level: str
@@ -39,6 +38,19 @@ class DownloadPaperRequest(BaseModel):
     saq_count: Optional[int] = None
     laq_count: Optional[int] = None
 
+# Response models let FastAPI serialize straight to JSON with pydantic
+class GeneratedPaperSummary(BaseModel):
+    paperHeading: str
+    totalMarks: int
+    content_based: bool
+    service_used: bool
+    extracted_content_files: int
+
+class GeneratePaperResponse(BaseModel):
+    message: str
+    paper: GeneratedPaperSummary
+    saved_as_latest: bool
+
 # Store latest paper in router state
 def get_latest_paper_storage():
     if not hasattr(router, 'latest_generated_paper'):
@@ -480,7 +492,7 @@ QUESTIONS:
         return buffer
 
 # --- UPDATED API Endpoints ---
-@router.post("/generate-paper")
+@router.post("/generate-paper", response_model=GeneratePaperResponse)
 async def generate_paper(
     paperHeading: str = Form(...),
     totalMarks: int = Form(...),
@@ -520,7 +532,8 @@ async def generate_paper(
     for file in files:
         file_path = UPLOAD_DIR / file.filename
         with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+            while chunk := await file.read(1 << 20):
+                buffer.write(chunk)
         saved_files.append(str(file_path))
         print(f"💾 Saved file: {file_path}")
 
@@ -531,7 +544,7 @@ async def generate_paper(
     print("=== CONTENT EXTRACTION ===")
     for file_path in saved_files:
         print(f"🔍 Processing: {file_path}")
-        extracted_text = extract_text_from_file_enhanced(file_path)
+        extracted_text = await asyncio.to_thread(extract_text_from_file_enhanced, file_path)
         print(f"📊 Extraction result: {len(extracted_text)} chars")
         
         # Enhanced content validation
@@ -564,7 +577,8 @@ async def generate_paper(
         if chunks:
             print("🚀 ATTEMPTING UNIFIED SERVICE QUESTION GENERATION")
             # Try unified service first
-            questions_content = generate_questions_with_service(
+            questions_content = await asyncio.to_thread(
+                generate_questions_with_service,
                 chunks, mcqCount, saqCount, laqCount, mcqDifficulty, paperHeading
             )
             
@@ -617,27 +631,28 @@ async def generate_paper(
     print(f"=== PAPER GENERATION COMPLETED ===")
     print(f"🤖 Service Used: {service_used}")
     print(f"📚 Content-based: {extracted_file_count > 0}")
-    return JSONResponse({
-        "message": "Paper generated successfully!", 
+    return {
+        "message": "Paper generated successfully!",
         "paper": response_data,
         "saved_as_latest": True
-    })
+    }
 
 # Keep other endpoints the same...
-@router.get("/latest-paper")
+@router.get("/latest-paper", response_model=None)
 async def get_latest_paper():
     latest_paper = get_latest_paper_storage()
     if latest_paper is None:
         raise HTTPException(status_code=404, detail="No generated paper found. Please generate a paper first.")
-    return latest_paper
+    # Polled by the UI; encode directly and skip FastAPI's response handling
+    return Response(content=msgspec.json.encode(latest_paper), media_type="application/json")
 
 @router.post("/download-paper")
 async def download_paper(paper_request: DownloadPaperRequest):
     try:
-        paper_data = paper_request.dict()
+        paper_data = paper_request.model_dump()
         
         # Generate PDF using FIXED function
-        pdf_buffer = generate_pdf_content(paper_data)
+        pdf_buffer = await asyncio.to_thread(generate_pdf_content, paper_data)
         
         # Return PDF file
         filename = f"{paper_data['title'].replace(' ', '_')}.pdf"
@@ -1,8 +1,10 @@
+import asyncio
 from fastapi import APIRouter, UploadFile, Form
 from chunker.chunker import split_text_to_chunks
 from chunker.embedder import embed_chunks
 from qdrant.indexer import upsert_chunks
-from qdrant.schema import create_collection
+from qdrant.schema import COLLECTION, create_collection
+from services.query_cache import query_cache
 import fitz
 import os
 
@@ -16,25 +18,33 @@ def extract_text(pdf_path):
         text += page.get_text()
     return text
 
+def index_file(pdf_path, doc_id):
+    """Extract, chunk, embed and upsert a PDF; returns the number of chunks"""
+    text = extract_text(pdf_path)
+    chunks = split_text_to_chunks(text)
+    embeddings = embed_chunks(chunks)
+
+    create_collection()
+    upsert_chunks(chunks, embeddings, doc_id)
+    query_cache.invalidate(COLLECTION)
+    return len(chunks)
+
 @router.post("/add-document")
 async def add_document(file: UploadFile, doc_id: str = Form(...)):
     temp_path = f"temp_{file.filename}"
 
-    # save temp file
+    # save temp file in 1 MiB chunks
     with open(temp_path, "wb") as f:
-        f.write(await file.read())
+        while chunk := await file.read(1 << 20):
+            f.write(chunk)
 
     try:
-        text = extract_text(temp_path)
-        chunks = split_text_to_chunks(text)
-        embeddings = embed_chunks(chunks)
-
-        create_collection()
-        upsert_chunks(chunks, embeddings, doc_id)
+        # PyMuPDF and embedding are blocking, keep them off the event loop
+        chunk_count = await asyncio.to_thread(index_file, temp_path, doc_id)
 
         return {
             "doc_id": doc_id,
-            "chunks": len(chunks),
+            "chunks": chunk_count,
         }
     finally:
         os.remove(temp_path)
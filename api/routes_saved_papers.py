@@ -1,10 +1,11 @@
 # api/routes/saved_papers.py
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import FileResponse, Response
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from pathlib import Path
 import json
+import msgspec
 import uuid
 from datetime import datetime
 
@@ -19,6 +20,8 @@ GENERATED_PAPER_FILE.touch(exist_ok=True)
 
 # Extended Pydantic Model with content support
 class Paper(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
     id: int
     title: str
     level: str
@@ -29,6 +32,32 @@ class Paper(BaseModel):
     questions: Optional[str] = None
 
 class GeneratedPaper(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
+    id: int
+    title: str
+    level: str
+    date: str
+    content: Optional[str] = None
+    subject: Optional[str] = None
+    topic: Optional[str] = None
+    questions: Optional[str] = None
+
+# Response models let FastAPI serialize straight to JSON with pydantic
+class MessageResponse(BaseModel):
+    message: str
+
+class DownloadPaperResponse(BaseModel):
+    message: str
+    paper: Paper
+    note: str
+
+class GeneratePaperResponse(BaseModel):
+    message: str
+    paper: GeneratedPaper
+
+# msgspec mirror of Paper for the hot listing route; unknown fields are dropped
+class SavedPaper(msgspec.Struct):
     id: int
     title: str
     level: str
@@ -39,17 +68,19 @@ class GeneratedPaper(BaseModel):
     questions: Optional[str] = None
 
 # --- Get all saved papers ---
-@router.get("/saved-papers", response_model=List[Paper])
+@router.get("/saved-papers", response_model=None)
 async def get_saved_papers():
-    with open(SAVE_FILE, "r") as f:
-        try:
-            data = json.load(f)
-        except:
-            data = []
-    return data
+    # An empty or unparsable file means no papers yet; a malformed record is a
+    # real error and surfaces as a 500, like the pydantic response_model did
+    try:
+        raw = msgspec.json.decode(SAVE_FILE.read_bytes())
+    except msgspec.DecodeError:
+        raw = []
+    papers = msgspec.convert(raw, type=List[SavedPaper], strict=False)
+    return Response(content=msgspec.json.encode(papers), media_type="application/json")
 
 # --- Save new paper ---
-@router.post("/saved-papers")
+@router.post("/saved-papers", response_model=MessageResponse)
 async def save_paper(paper: Paper):
     with open(SAVE_FILE, "r+") as f:
         try:
@@ -62,12 +93,12 @@ async def save_paper(paper: Paper):
         if paper_exists:
             raise HTTPException(status_code=400, detail="Paper with this ID already exists")
         
-        data.append(paper.dict())
+        data.append(paper.model_dump())
         f.seek(0)
         json.dump(data, f, indent=4)
         f.truncate()
     
-    return JSONResponse({"message": "Paper saved successfully!"})
+    return {"message": "Paper saved successfully!"}
 
 # --- Get latest generated paper ---
 @router.get("/latest-paper")
@@ -86,29 +117,29 @@ async def get_latest_paper():
         raise HTTPException(status_code=404, detail="No generated paper found")
 
 # --- Save generated paper (for when paper is generated) ---
-@router.post("/save-generated-paper")
+@router.post("/save-generated-paper", response_model=MessageResponse)
 async def save_generated_paper(paper: GeneratedPaper):
     try:
         with open(GENERATED_PAPER_FILE, "w") as f:
-            json.dump(paper.dict(), f, indent=4)
-        return JSONResponse({"message": "Generated paper saved successfully!"})
+            json.dump(paper.model_dump(), f, indent=4)
+        return {"message": "Generated paper saved successfully!"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save generated paper: {str(e)}")
 
 # --- Download paper as PDF (placeholder - returns JSON for now) ---
-@router.post("/download-paper")
+@router.post("/download-paper", response_model=DownloadPaperResponse)
 async def download_paper(paper: Paper):
     try:
         # For now, we'll return a JSON response since PDF generation requires additional libraries
         # In production, you would use libraries like reportlab, weasyprint, or pdfkit
-        return JSONResponse({
+        return {
             "message": "PDF download functionality",
-            "paper": paper.dict(),
+            "paper": paper,
             "note": "PDF generation would be implemented here with libraries like reportlab or weasyprint"
-        })
+        }
         
         # Example of actual PDF implementation (commented out):
-        # pdf_content = generate_pdf(paper.dict())
+        # pdf_content = generate_pdf(paper.model_dump())
         # return Response(
         #     content=pdf_content,
         #     media_type="application/pdf",
@@ -133,7 +164,7 @@ async def get_paper_by_id(paper_id: int):
     return paper
 
 # --- Delete paper by ID ---
-@router.delete("/paper/{paper_id}")
+@router.delete("/paper/{paper_id}", response_model=MessageResponse)
 async def delete_paper(paper_id: int):
     with open(SAVE_FILE, "r+") as f:
         try:
@@ -151,10 +182,10 @@ async def delete_paper(paper_id: int):
         json.dump(data, f, indent=4)
         f.truncate()
     
-    return JSONResponse({"message": "Paper deleted successfully!"})
+    return {"message": "Paper deleted successfully!"}
 
 # --- Update the generate-paper endpoint to also save as latest generated paper ---
-@router.post("/generate-paper")
+@router.post("/generate-paper", response_model=GeneratePaperResponse)
 async def generate_paper_endpoint(paper_data: dict):
     try:
         # Your existing paper generation logic here
@@ -174,12 +205,12 @@ async def generate_paper_endpoint(paper_data: dict):
         
         # Save as latest generated paper
         with open(GENERATED_PAPER_FILE, "w") as f:
-            json.dump(generated_paper.dict(), f, indent=4)
+            json.dump(generated_paper.model_dump(), f, indent=4)
         
-        return JSONResponse({
+        return {
             "message": "Paper generated successfully!",
-            "paper": generated_paper.dict()
-        })
+            "paper": generated_paper
+        }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate paper: {str(e)}")
\ No newline at end of file
@@ -1,35 +1,53 @@
 # routes_search.py
+import asyncio
+from typing import List, Optional
 from fastapi import APIRouter
+from pydantic import BaseModel
 from chunker.embedder import embed_chunks
 from qdrant.client import get_client
-from qdrant.schema import COLLECTION, create_collection
+from qdrant.schema import COLLECTION, SEARCH_PARAMS, create_collection
 from qdrant_client.models import VectorParams, Distance
+from services.query_cache import query_cache
 
 router = APIRouter()
 
-@router.get("/query")
-def semantic_search(query: str, top_k: int = 5):
+class SearchMatch(BaseModel):
+    score: float
+    text: Optional[str] = None
+    doc_id: Optional[str] = None
+
+class SearchResponse(BaseModel):
+    query: str
+    matches: List[SearchMatch]
+
+@router.get("/query", response_model=SearchResponse)
+async def semantic_search(query: str, top_k: int = 5):
     client = get_client()
 
     # Ensure collection exists
-    create_collection()
+    await asyncio.to_thread(create_collection)
 
-    query_vec = embed_chunks([query])[0]
+    query_vec = (await asyncio.to_thread(embed_chunks, [query]))[0]
 
-    results = client.query_points(
-        collection_name=COLLECTION,
-        query=query_vec,
-        limit=top_k
+    key = query_cache.make_key(COLLECTION, query_vec, top_k)
+    results = await asyncio.to_thread(
+        query_cache.get_or_compute,
+        key,
+        lambda: client.query_points(
+            collection_name=COLLECTION,
+            query=query_vec,
+            limit=top_k,
+            search_params=SEARCH_PARAMS
+        )
     )
 
-    # Unpack tuples returned by Qdrant
     matches = [
         {
-            "score": score,
+            "score": point.score,
             "text": point.payload.get("chunk_text"),
             "doc_id": point.payload.get("doc_id")
         }
-        for point, score in results
+        for point in results.points
     ]
 
     return {
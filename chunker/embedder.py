@@ -1,7 +1,9 @@
+import os
 import numpy as np
+from functools import lru_cache
 
 # Set embedding dimension to match Qdrant collection
-EMBED_DIM = 384  # Must match the dimension used in create_collection()
+EMBED_DIM = 384  # qdrant.schema.VECTOR_SIZE is derived from this
 
 # Dummy model for testing without sentence-transformers
 class DummyModel:
@@ -10,15 +12,59 @@ class DummyModel:
         Return a random vector for each chunk.
         Each vector has EMBED_DIM floats.
         """
-        return [np.random.rand(EMBED_DIM).tolist() for _ in chunks]
+        rng = np.random.default_rng()
+        return rng.random((len(chunks), EMBED_DIM), dtype=np.float32).tolist()
 
-# Use dummy model
-model = DummyModel()
+# Real model, quantized for CPU inference
+class QuantizedSentenceModel:
+    def __init__(self, model_name):
+        """
+        Load a SentenceTransformer and dynamically quantize its Linear layers
+        to INT8. The model must output EMBED_DIM-sized vectors
+        (e.g. all-MiniLM-L6-v2).
+        """
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        model = SentenceTransformer(model_name, device="cpu")
+        dim = model.get_sentence_embedding_dimension()
+        if dim != EMBED_DIM:
+            raise ValueError(
+                f"{model_name} outputs {dim}-dim vectors, but the collection expects {EMBED_DIM}"
+            )
+        self.model = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+    def encode(self, chunks):
+        embeddings = self.model.encode(
+            chunks, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+        )
+        return embeddings.tolist()
+
+@lru_cache(maxsize=1)
+def get_embedder():
+    """Build the embedding model once and share it across requests"""
+    # EMBED_MODEL opts into a real sentence-transformers model
+    model_name = os.getenv("EMBED_MODEL")
+    if model_name:
+        # Fall back on any load failure (missing package, unknown model, no
+        # network, wrong dimension); lru_cache would not cache an exception,
+        # so re-raising would retry the load on every call
+        try:
+            return QuantizedSentenceModel(model_name)
+        except ImportError as e:
+            print(f"sentence-transformers not available ({e}), using dummy model")
+        except Exception as e:
+            print(f"Could not load embedding model {model_name!r} ({e}), using dummy model")
+
+    # Use dummy model
+    return DummyModel()
 
 def embed_chunks(chunks):
     """
     Generate vector embeddings for a list of text chunks.
     Works without the sentence-transformers package.
     """
-    embeddings = model.encode(chunks)
+    embeddings = get_embedder().encode(chunks)
     return embeddings
@@ -1,12 +1,28 @@
 # main.py
+import asyncio
+import logging
+import logging.handlers
 import os
-import sys
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel
+from typing import Optional
 
-# Add services to path
-sys.path.append(str(Path(__file__).parent / "services"))
+# Buffer log records and write them out in batches (or straight away on
+# errors) instead of a stdout write per message during ingestion.
+# `python main.py` loads this file twice (as __main__, then as main for
+# uvicorn), so only the first load configures the shared logger.
+logger = logging.getLogger("main")
+if not logger.handlers:
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s:     %(message)s"))
+    logger.addHandler(logging.handlers.MemoryHandler(
+        1024, flushLevel=logging.ERROR, target=stream_handler
+    ))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+log_handler = logger.handlers[0]
 
 # Import routers
 from api.routes_search import router as search_router
@@ -15,27 +31,30 @@ from api.routes_auth import router as auth_router
 from api.routes_generate_paper import router as generate_paper_router
 from api.routes_saved_papers import router as saved_papers
 
-# Import exam generation router
-try:
+# Import exam generation router (disable with ENABLE_EXAM_GEN=0)
+EXAM_GEN_AVAILABLE = os.getenv("ENABLE_EXAM_GEN", "1") == "1"
+if EXAM_GEN_AVAILABLE:
     from api.routes_exam_generation import router as exam_generation_router
-    EXAM_GEN_AVAILABLE = True
-except ImportError as e:
-    print(f"Exam generation routes not available: {e}")
-    EXAM_GEN_AVAILABLE = False
+else:
+    logger.info("Exam generation routes disabled by ENABLE_EXAM_GEN")
 
 # Import services
 try:
     from services.data_ingestion import PDFIngestor
-    from qdrant.schema import create_collection
+    from services.ingest_ledger import IngestLedger
+    from services.query_cache import query_cache
+    from chunker.embedder import get_embedder
+    from qdrant.client import LOCAL_MODE
+    from qdrant.schema import COLLECTION, create_collection, warm_collection
     SERVICES_AVAILABLE = True
 except ImportError as e:
-    print(f"Some services not available: {e}")
+    logger.warning(f"Some services not available: {e}")
     SERVICES_AVAILABLE = False
 
 # ----------------------------
 # 1️⃣ Setup FastAPI app
 # ----------------------------
-app = FastAPI(title="Semantic Chunking & Qdrant API") 
+app = FastAPI(title="Semantic Chunking & Qdrant API")
 
 # Include all routers
 app.include_router(generate_paper_router, prefix="/api", tags=["Paper"])
@@ -57,47 +76,221 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.get("/health")
+# Response models let FastAPI serialize straight to JSON with pydantic
+class IngestStatus(BaseModel):
+    state: str
+    total: int
+    done: int
+    skipped: int
+    failed: int
+
+class HealthStatus(BaseModel):
+    status: str
+    exam_generation: bool
+    query_cache_hit_rate: Optional[float] = None
+
+class SystemHealth(HealthStatus):
+    ingestion: IngestStatus
+
+class ServiceStatus(BaseModel):
+    status: str
+    message: str
+
+class GeminiStatus(BaseModel):
+    available: bool
+    error: Optional[str] = None
+
+class FullHealth(BaseModel):
+    exam: ServiceStatus
+    gemini: GeminiStatus
+    system: SystemHealth
+
+# Progress of the background PDF ingestion started on startup
+INGEST_STATUS = {
+    "state": "running" if SERVICES_AVAILABLE else "unavailable",
+    "total": 0,
+    "done": 0,
+    "skipped": 0,
+    "failed": 0,
+}
+
+@app.get("/health", response_model=HealthStatus, response_model_exclude_none=True)
 def health_check():
-    return {"status": "ok", "exam_generation": EXAM_GEN_AVAILABLE}
+    health = {"status": "ok", "exam_generation": EXAM_GEN_AVAILABLE}
+    if SERVICES_AVAILABLE:
+        health["query_cache_hit_rate"] = round(query_cache.hit_rate, 4)
+    return health
+
+@app.get("/ingest/status", response_model=IngestStatus)
+def ingest_status():
+    return INGEST_STATUS
+
+async def exam_status():
+    if not EXAM_GEN_AVAILABLE:
+        return {"status": "unavailable", "message": "Exam generation routes not loaded"}
+    try:
+        from services.exam_service import exam_service
+        if await asyncio.to_thread(exam_service.initialize_controller):
+            return {"status": "available", "message": "Exam generation service is ready"}
+        return {"status": "unavailable", "message": "Exam generation service failed to initialize"}
+    except Exception as e:
+        return {"status": "error", "message": f"Service check failed: {str(e)}"}
+
+def gemini_status():
+    try:
+        from services.exam_service import exam_service
+        gemini_ai = getattr(exam_service.controller, "gemini_ai", None)
+        return {"available": bool(getattr(gemini_ai, "available", False))}
+    except Exception as e:
+        return {"available": False, "error": str(e)}
+
+def system_health():
+    return {**health_check(), "ingestion": INGEST_STATUS}
+
+@app.get("/health/full", response_model=FullHealth, response_model_exclude_none=True)
+async def full_health_check():
+    """Exam, Gemini and system status in a single round-trip"""
+    # Gemini's status comes from the controller that exam_status() builds,
+    # so read it only once that check has finished
+    exam = await exam_status()
+    return {"exam": exam, "gemini": gemini_status(), "system": system_health()}
 
 # ----------------------------
 # 2️⃣ Ingest PDFs on startup (if services available)
 # ----------------------------
+def _ingest_one(file_path):
+    """Parse and chunk a single PDF (runs in a worker process)"""
+    return PDFIngestor().ingest(file_path)
+
 if SERVICES_AVAILABLE:
     PDF_FOLDER = "pdfs"
+    INGEST_DB = "ingested.sqlite3"
     ingestor = PDFIngestor()
+    # The in-memory collection starts empty in every process, so a ledger
+    # could only ever be reset (or, shared between workers, wrongly skip
+    # files another worker ingested into its own store)
+    ledger = None if LOCAL_MODE else IngestLedger(INGEST_DB)
+    _ingest_task = None
+
+    async def _ingest_file(executor, upsert_lock, seen_hashes, file_path, mtime_ns):
+        loop = asyncio.get_running_loop()
+        filename = os.path.basename(file_path)
+        try:
+            # Skip files whose exact contents are already in the collection;
+            # an unchanged path and mtime avoids hashing the file at all
+            if ledger is not None and await asyncio.to_thread(ledger.is_unchanged, file_path, mtime_ns):
+                INGEST_STATUS["skipped"] += 1
+                logger.info(f"Skipped {filename} (unchanged)")
+                return
+            file_hash = await asyncio.to_thread(IngestLedger.file_hash, file_path)
+            if file_hash in seen_hashes or (
+                ledger is not None and await asyncio.to_thread(ledger.is_ingested, file_hash)
+            ):
+                INGEST_STATUS["skipped"] += 1
+                logger.info(f"Skipped {filename} (already ingested)")
+                return
+            seen_hashes.add(file_hash)
+
+            chunks = await loop.run_in_executor(executor, _ingest_one, file_path)
+            # The in-memory Qdrant client is shared, so upserts go one at a time
+            async with upsert_lock:
+                await ingestor.ingest_to_qdrant(file_path, chunks)
+            query_cache.invalidate(COLLECTION)
+            if ledger is not None:
+                await asyncio.to_thread(ledger.mark_ingested, file_hash, file_path, mtime_ns)
+            INGEST_STATUS["done"] += 1
+            logger.info(f"Ingested {filename}")
+        except Exception as e:
+            INGEST_STATUS["failed"] += 1
+            logger.error(f"Failed to ingest {filename}: {e}")
+
+    async def _ingest_all_async():
+        """Ingest every PDF in PDF_FOLDER, then warm the index, without blocking startup"""
+        if not os.path.exists(PDF_FOLDER):
+            logger.info(f"No PDF folder found at '{PDF_FOLDER}', skipping ingestion.")
+            INGEST_STATUS["state"] = "completed"
+            log_handler.flush()
+            return
+
+        # Parsing fans out across processes; embedding and upserting stay
+        # in this process because the Qdrant client is in-memory.
+        with os.scandir(PDF_FOLDER) as entries:
+            files = [
+                (entry.path, entry.stat().st_mtime_ns)
+                for entry in entries
+                if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(".pdf")
+            ]
+        INGEST_STATUS["total"] = len(files)
+        upsert_lock = asyncio.Lock()
+        seen_hashes = set()
+        executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        try:
+            await asyncio.gather(*(
+                _ingest_file(executor, upsert_lock, seen_hashes, path, mtime_ns)
+                for path, mtime_ns in files
+            ))
+        finally:
+            # If the task is cancelled at shutdown, don't block the event loop
+            # waiting for parses still running in the pool
+            executor.shutdown(wait=False, cancel_futures=True)
+        INGEST_STATUS["state"] = "completed"
+        logger.info(
+            f"PDF ingestion completed: {INGEST_STATUS['done']} ingested, "
+            f"{INGEST_STATUS['skipped']} skipped, {INGEST_STATUS['failed']} failed"
+        )
+
+        # Pull the freshly built index into memory before real searches arrive
+        try:
+            await asyncio.to_thread(warm_collection)
+        except Exception as e:
+            logger.error(f"Collection warm-up failed: {e}")
+
+        # Ingestion is done; don't leave its progress sitting in the buffer
+        log_handler.flush()
+
+    async def _startup_background():
+        """Slow startup work that must not hold up serving requests"""
+        # Load the embedding model now so the first search doesn't pay for it
+        await asyncio.to_thread(get_embedder)
 
-    @app.on_event("startup")
-    def startup_event():
-        # Ensure collection exists
-        create_collection()
-        print("Qdrant collection check completed.")
-        
         # Initialize exam service if available
         if EXAM_GEN_AVAILABLE:
             try:
                 from services.exam_service import exam_service
-                print("Initializing exam generation service...")
-                if exam_service.initialize_controller():
-                    print("Exam generation service initialized successfully")
+                logger.info("Initializing exam generation service...")
+                # Builds Gemini clients and probes models over the network
+                if await asyncio.to_thread(exam_service.initialize_controller):
+                    logger.info("Exam generation service initialized successfully")
                 else:
-                    print("Exam generation service initialization failed")
+                    logger.error("Exam generation service initialization failed")
             except Exception as e:
-                print(f"Error initializing exam service: {e}")
-
-        # Ingest PDFs if folder exists
-        if os.path.exists(PDF_FOLDER):
-            for filename in os.listdir(PDF_FOLDER):
-                if filename.lower().endswith(".pdf"):
-                    file_path = os.path.join(PDF_FOLDER, filename)
-                    try:
-                        ingestor.ingest_to_qdrant(file_path)
-                        print(f"Ingested {filename}")
-                    except Exception as e:
-                        print(f"Failed to ingest {filename}: {e}")
-        else:
-            print(f"No PDF folder found at '{PDF_FOLDER}', skipping ingestion.")
+                logger.error(f"Error initializing exam service: {e}")
+
+        await _ingest_all_async()
+
+    @app.on_event("startup")
+    async def startup_event():
+        global _ingest_task
+
+        # Ensure collection exists. A freshly created collection holds none of
+        # the vectors the ledger remembers, so everything must be re-ingested.
+        if create_collection() and ledger is not None:
+            ledger.reset()
+        logger.info("Qdrant collection check completed.")
+
+        # Warm services and ingest PDFs in the background so the server starts
+        # accepting requests immediately; progress is exposed on /ingest/status.
+        _ingest_task = asyncio.create_task(_startup_background())
+
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        # Stop a still-running ingestion instead of leaving it to be destroyed
+        # with the event loop
+        if _ingest_task is not None and not _ingest_task.done():
+            _ingest_task.cancel()
+            await asyncio.gather(_ingest_task, return_exceptions=True)
+            INGEST_STATUS["state"] = "cancelled"
+        log_handler.flush()
 
 # ----------------------------
 # 3️⃣ Run server
@@ -105,6 +298,24 @@ if SERVICES_AVAILABLE:
 if __name__ == "__main__":
     try:
         import uvicorn
-        uvicorn.run("main:app", host="127.0.0.1", port=8001, reload=True)
     except ImportError:
-        print("Uvicorn is not installed. Install with: pip install 'uvicorn[standard]'")
\ No newline at end of file
+        logger.error("Uvicorn is not installed. Install with: pip install 'uvicorn[standard]'")
+    else:
+        host = os.getenv("HOST", "127.0.0.1")
+        port = int(os.getenv("PORT", "8001"))
+        if os.getenv("DEBUG") == "1":
+            uvicorn.run("main:app", host=host, port=port, reload=True)
+        else:
+            # Qdrant, the latest paper and users all live in process memory,
+            # so each worker has its own copy; raise WORKERS only with care.
+            # "auto" picks uvloop/httptools when installed and falls back to
+            # asyncio/h11 otherwise.
+            uvicorn.run(
+                "main:app",
+                host=host,
+                port=port,
+                workers=int(os.getenv("WORKERS", "1")),
+                loop="auto",
+                http="auto",
+                log_level="info",
+            )
@@ -1,7 +1,15 @@
+import os
+
 from qdrant_client import QdrantClient
 
-# In-memory Qdrant (no Docker needed)
-client = QdrantClient(":memory:")
+# Set QDRANT_URL to use a Qdrant server; otherwise run in-memory (no Docker needed)
+QDRANT_URL = os.getenv("QDRANT_URL")
+
+# Local mode does exact brute-force search: index, quantization and search
+# params are accepted but have no effect there
+LOCAL_MODE = not QDRANT_URL
+
+client = QdrantClient(url=QDRANT_URL) if QDRANT_URL else QdrantClient(":memory:")
 
 def get_client():
     return client
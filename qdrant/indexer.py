@@ -2,24 +2,31 @@ from qdrant.client import get_client
 from qdrant_client.models import PointStruct
 import uuid
 
-def upsert_chunks(chunks, embeddings, doc_id="doc_1"):
+UPSERT_BATCH_SIZE = 512
+
+def upsert_chunks(chunks, embeddings, doc_id="doc_1", batch_size=UPSERT_BATCH_SIZE, start=0, wait=True):
     """
     Insert chunks and embeddings into Qdrant collection.
+    start is the chunk_id of the first chunk, for documents sent in parts.
+    Points are sent in batches; only the final batch waits for Qdrant to
+    apply it (and only if wait is set), so earlier batches pipeline behind it.
     """
     client = get_client()
-    points = []
 
-    for i, (chunk, vector) in enumerate(zip(chunks, embeddings)):
-        points.append(
+    for i in range(0, len(chunks), batch_size):
+        points = [
             PointStruct(
                 id=str(uuid.uuid4()),  # Valid UUID for each point
                 vector=vector,
                 payload={
                     "doc_id": doc_id,
                     "chunk_text": chunk,
-                    "chunk_id": i
+                    "chunk_id": start + i + j
                 }
             )
-        )
-
-    client.upsert(collection_name="doc_chunks", points=points)
+            for j, (chunk, vector) in enumerate(
+                zip(chunks[i:i + batch_size], embeddings[i:i + batch_size])
+            )
+        ]
+        is_last = i + batch_size >= len(chunks)
+        client.upsert(collection_name="doc_chunks", points=points, wait=wait and is_last)
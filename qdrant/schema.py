@@ -1,21 +1,67 @@
 # schema.py
-from qdrant.client import get_client
-from qdrant_client.models import VectorParams, Distance
+import numpy as np
+from chunker.embedder import EMBED_DIM
+from qdrant.client import LOCAL_MODE, get_client
+from qdrant_client.models import (
+    VectorParams,
+    Distance,
+    HnswConfigDiff,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+)
 
 # === Constants used in all Qdrant operations ===
 COLLECTION = "doc_chunks"
-VECTOR_SIZE = 384
+VECTOR_SIZE = EMBED_DIM  # the embedder validates its model against this
 DISTANCE = Distance.COSINE  # use Qdrant Distance object
 
+# INT8 scalar quantization keeps a 4x smaller copy of the vectors in RAM;
+# searches oversample on it and rescore with the original vectors.
+# None of this applies to the in-memory client (see qdrant.client.LOCAL_MODE).
+QUANTIZATION = ScalarQuantization(
+    scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+)
+HNSW_CONFIG = HnswConfigDiff(m=16, ef_construct=128, on_disk=False)
+SEARCH_PARAMS = None if LOCAL_MODE else SearchParams(
+    quantization=QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+WARMUP_SEARCH_PARAMS = SearchParams(
+    hnsw_ef=64,
+    quantization=QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+
 def create_collection():
-    """Create Qdrant collection if not exists"""
+    """Create Qdrant collection if not exists. Returns True if it was created."""
     client = get_client()
     collections = [c.name for c in client.get_collections().collections]
     if COLLECTION not in collections:
         client.recreate_collection(
             collection_name=COLLECTION,
-            vectors_config=VectorParams(size=VECTOR_SIZE, distance=DISTANCE)
+            vectors_config=VectorParams(size=VECTOR_SIZE, distance=DISTANCE),
+            hnsw_config=None if LOCAL_MODE else HNSW_CONFIG,
+            quantization_config=None if LOCAL_MODE else QUANTIZATION
         )
         print(f"Collection '{COLLECTION}' created.")
+        return True
     else:
         print(f"Collection '{COLLECTION}' already exists.")
+        return False
+
+def warm_collection(num_queries=16):
+    """Run a few synthetic searches so the first real ones don't hit a cold index"""
+    if LOCAL_MODE:
+        # Brute-force search has no index to warm
+        return
+    client = get_client()
+    rng = np.random.default_rng()
+    for query_vector in rng.standard_normal((num_queries, VECTOR_SIZE), dtype=np.float32):
+        client.query_points(
+            collection_name=COLLECTION,
+            query=query_vector.tolist(),
+            limit=10,
+            search_params=WARMUP_SEARCH_PARAMS
+        )
+    print(f"Collection '{COLLECTION}' warmed up with {num_queries} queries.")
\ No newline at end of file
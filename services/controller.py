@@ -8,7 +8,7 @@ try:
     # Try absolute imports first
     from services.data_ingestion import PDFIngestor
     from services.embedding_qdrant import VectorMemory  # FIXED: embedding_qdrant → embeddings_qdrant
-    from services.gemini_integration import GeminiAI
+    from services.gemini_integration import GeminiAI, get_gemini_ai
     from services.question_generation import QuestionGenerator
     from services.marks_analyzer import MarksAnalyzer
 except ImportError as e:
@@ -17,13 +17,13 @@ except ImportError as e:
     try:
         from .data_ingestion import PDFIngestor
         from .embedding_qdrant import VectorMemory
-        from .gemini_integration import GeminiAI
+        from .gemini_integration import GeminiAI, get_gemini_ai
         from .question_generation import QuestionGenerator
         from .marks_analyzer import MarksAnalyzer
     except ImportError as e2:
         print(f"Relative import also failed: {e2}")
         # Use fallback classes (keep your existing fallbacks)
-        from data_ingestion import PDFIngestor
+        from services.data_ingestion import PDFIngestor
         
         # Fallback for VectorMemory
         class VectorMemory:
@@ -62,6 +62,8 @@ except ImportError as e:
                     }
                 }
         
+        get_gemini_ai = GeminiAI
+
         class QuestionGenerator:
             def __init__(self, api_key=None):
                 self.api_key = api_key
@@ -113,9 +115,10 @@ except ImportError as e:
 
 class ExamForgeController:
     def __init__(self, google_api_key=None, qdrant_url=":memory:"):
+        self.google_api_key = google_api_key
         self.ingestor = PDFIngestor()
         self.vector_store = VectorMemory(qdrant_url, "exam_chunks", google_api_key)
-        self.gemini_ai = GeminiAI(google_api_key)
+        self.gemini_ai = get_gemini_ai(google_api_key)
         self.question_gen = QuestionGenerator(google_api_key)
         self.marks_analyzer = MarksAnalyzer()
 
@@ -123,6 +126,15 @@ class ExamForgeController:
         if google_api_key:
             os.environ['GOOGLE_API_KEY'] = google_api_key
 
+    def refresh_gemini(self):
+        """Pick up a working Gemini client if the one we were built with was unavailable"""
+        if getattr(self.gemini_ai, 'available', False):
+            return True
+        self.gemini_ai = get_gemini_ai(self.google_api_key)
+        if hasattr(self.question_gen, 'gemini'):
+            self.question_gen.gemini = self.gemini_ai
+        return getattr(self.gemini_ai, 'available', False)
+
     def process_pdf(self, file_path: str):
         """Process PDF and store in vector database"""
         print("Starting PDF processing...")
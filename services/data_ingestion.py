@@ -1,4 +1,5 @@
 # services/data_ingestion.py
+import asyncio
 import os
 import fitz  # PyMuPDF
 import pytesseract
@@ -18,19 +19,19 @@ class PDFIngestor:
         """Extract text from PDF using PyMuPDF"""
         try:
             print(f"🔍 Extracting text from: {file_path}")
-            doc = fitz.open(file_path)
-            text = ""
-            for page_num, page in enumerate(doc):
-                try:
-                    page_text = page.get_text("text")
-                    if page_text.strip():
-                        text += f"\n--- Page {page_num + 1} ---\n{page_text}"
-                        print(f"✅ Page {page_num + 1}: {len(page_text)} chars")
-                except Exception as e:
-                    print(f"⚠️ Error extracting text from page {page_num}: {e}")
-                    continue
-            doc.close()
-            
+            pages = []
+            with fitz.open(file_path) as doc:
+                for page_num, page in enumerate(doc):
+                    try:
+                        page_text = page.get_text("text")
+                        if page_text.strip():
+                            pages.append(f"\n--- Page {page_num + 1} ---\n{page_text}")
+                    except Exception as e:
+                        print(f"⚠️ Error extracting text from page {page_num}: {e}")
+                        continue
+            print(f"✅ Extracted text from {len(pages)} pages")
+            text = "".join(pages)
+
             if text.strip():
                 print(f"✅ Successfully extracted {len(text)} characters")
                 return text
@@ -101,17 +102,88 @@ class PDFIngestor:
 
         return chunks
 
+    async def ingest_to_qdrant(self, file_path, chunks=None, batch_size=64, queue_size=8):
+        """
+        Embed PDF chunks and upsert them into the Qdrant collection.
+        Embedding and upserting run as a pipeline over bounded queues, so the
+        next batch is embedded while the previous one is being upserted, and
+        at most queue_size embedded batches wait for the upsert stage.
+        """
+        from chunker.embedder import embed_chunks
+        from qdrant.indexer import UPSERT_BATCH_SIZE, upsert_chunks
+
+        if chunks is None:
+            chunks = await asyncio.to_thread(self.ingest, file_path)
+
+        doc_id = os.path.basename(file_path)
+        chunk_queue = asyncio.Queue(maxsize=queue_size)
+        upsert_queue = asyncio.Queue(maxsize=queue_size)
+
+        async def parse_producer():
+            for start in range(0, len(chunks), batch_size):
+                await chunk_queue.put(chunks[start:start + batch_size])
+            await chunk_queue.put(None)
+
+        async def embed_worker():
+            while (batch := await chunk_queue.get()) is not None:
+                embeddings = await asyncio.to_thread(embed_chunks, batch)
+                await upsert_queue.put((batch, embeddings))
+            await upsert_queue.put(None)
+
+        async def upsert_worker():
+            # Regroup embedded batches into UPSERT_BATCH_SIZE requests. A
+            # remainder is always held back, so the final request is the one
+            # that waits for Qdrant to apply the document.
+            next_id, pending_chunks, pending_vectors = 0, [], []
+            while (item := await upsert_queue.get()) is not None:
+                batch, embeddings = item
+                pending_chunks.extend(batch)
+                pending_vectors.extend(embeddings)
+                while len(pending_chunks) > UPSERT_BATCH_SIZE:
+                    await asyncio.to_thread(
+                        upsert_chunks,
+                        pending_chunks[:UPSERT_BATCH_SIZE],
+                        pending_vectors[:UPSERT_BATCH_SIZE],
+                        doc_id,
+                        start=next_id,
+                        wait=False,
+                    )
+                    next_id += UPSERT_BATCH_SIZE
+                    del pending_chunks[:UPSERT_BATCH_SIZE]
+                    del pending_vectors[:UPSERT_BATCH_SIZE]
+            if pending_chunks:
+                await asyncio.to_thread(
+                    upsert_chunks, pending_chunks, pending_vectors, doc_id, start=next_id
+                )
+
+        tasks = [
+            asyncio.create_task(parse_producer()),
+            asyncio.create_task(embed_worker()),
+            asyncio.create_task(upsert_worker()),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except Exception:
+            # Don't leave the other stages blocked on a queue forever
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        print(f"✅ Stored {len(chunks)} chunks from {file_path}")
+        return len(chunks)
+
     def ocr_extract(self, file_path):
         """Extract text using OCR for scanned PDFs"""
         try:
             print("🔄 Starting OCR extraction...")
             images = convert_from_path(file_path, dpi=200)  # Lower DPI for speed
-            text = ""
+            pages = []
             for i, img in enumerate(images):
                 print(f"📄 Processing page {i+1}/{len(images)} with OCR")
                 page_text = pytesseract.image_to_string(img)
-                text += f"\n--- Page {i+1} ---\n{page_text}"
-            return text
+                pages.append(f"\n--- Page {i+1} ---\n{page_text}")
+            return "".join(pages)
         except Exception as e:
             print(f"❌ Error in OCR extraction: {e}")
             return ""
@@ -139,9 +211,10 @@ class RecursiveCharacterTextSplitter:
             if end < len(text):
                 for separator in self.separators:
                     if separator:
-                        # Look for the separator before the end
-                        pos = text.rfind(separator, start, end)
-                        if pos != -1 and pos > start:
+                        # Look for the separator before the end, but past the
+                        # overlap so every chunk adds text the previous one lacked
+                        pos = text.rfind(separator, start + self.chunk_overlap, end)
+                        if pos != -1:
                             end = pos + len(separator)
                             break
             
@@ -149,11 +222,14 @@ class RecursiveCharacterTextSplitter:
             if chunk:
                 chunks.append(chunk)
             
-            # Move start position, considering overlap
-            start = end - self.chunk_overlap
-            if start < 0:
-                start = 0
             if end >= len(text):
                 break
 
+            # Move start position, considering overlap; drop the overlap when it
+            # would not move start forward (chunk_overlap >= chunk_size)
+            if end - self.chunk_overlap > start:
+                start = end - self.chunk_overlap
+            else:
+                start = end
+
         return chunks
\ No newline at end of file
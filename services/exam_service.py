@@ -1,13 +1,9 @@
 # services/exam_service.py
 import os
-import sys
-from pathlib import Path
+import threading
 from typing import Dict
 from datetime import datetime
 
-# Add the services directory to Python path
-sys.path.append(str(Path(__file__).parent))
-
 try:
     from services.controller import ExamForgeController
 except ImportError as e:
@@ -34,29 +30,39 @@ class ExamGenerationService:
             print(f"🔑 API Key loaded: {self.api_key[:8]}...")
         
         self.controller = None
+        # Startup warm-up and the status route may both get here first
+        self._init_lock = threading.Lock()
         
     def initialize_controller(self):
-        """Initialize the exam forge controller"""
-        try:
-            print("🔄 Initializing ExamForgeController...")
-            self.controller = ExamForgeController(google_api_key=self.api_key)
+        """Initialize the exam forge controller (once; later calls reuse it)"""
+        with self._init_lock:
+            if self.controller is not None:
+                # Keep the controller (and the documents it holds), but retry Gemini
+                # if it was unavailable when the controller was built
+                if hasattr(self.controller, 'refresh_gemini'):
+                    self.controller.refresh_gemini()
+                return True
+
+            try:
+                print("🔄 Initializing ExamForgeController...")
+                self.controller = ExamForgeController(google_api_key=self.api_key)
             
-            # Check if Gemini is available
-            if hasattr(self.controller, 'gemini_ai') and hasattr(self.controller.gemini_ai, 'available'):
-                print(f"🤖 Gemini AI Available: {self.controller.gemini_ai.available}")
-                if self.controller.gemini_ai.available:
-                    print("✅ Gemini AI will be used for question generation")
+                # Check if Gemini is available
+                if hasattr(self.controller, 'gemini_ai') and hasattr(self.controller.gemini_ai, 'available'):
+                    print(f"🤖 Gemini AI Available: {self.controller.gemini_ai.available}")
+                    if self.controller.gemini_ai.available:
+                        print("✅ Gemini AI will be used for question generation")
+                    else:
+                        print("⚠️ Gemini AI not available, using fallback generation")
                 else:
-                    print("⚠️ Gemini AI not available, using fallback generation")
-            else:
-                print("❌ Gemini AI initialization failed")
+                    print("❌ Gemini AI initialization failed")
                 
-            return True
-        except Exception as e:
-            print(f"❌ Error initializing controller: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
+                return True
+            except Exception as e:
+                print(f"❌ Error initializing controller: {e}")
+                import traceback
+                traceback.print_exc()
+                return False
     
     def generate_exam_from_pdf(self, pdf_path: str, query: str, 
                              mcq_count: int = 10, short_count: int = 5, 
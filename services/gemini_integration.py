@@ -2,6 +2,7 @@
 import google.generativeai as genai
 import os
 import json
+import threading
 import time
 from typing import List, Dict, Any
 
@@ -503,4 +504,26 @@ class GeminiAI:
                 "remember": 0.3, "understand": 0.4, "apply": 0.2,
                 "analyze": 0.1, "evaluate": 0.0, "create": 0.0
             }
-        }
\ No newline at end of file
+        }
+
+# Seconds before a GeminiAI that found no working model is built again
+GEMINI_RETRY_SECONDS = 60
+
+_gemini_instances = {}
+_gemini_lock = threading.Lock()
+
+def get_gemini_ai(api_key=None):
+    """
+    Shared GeminiAI instance; finding a working model costs several API calls.
+    An unavailable instance (no key, quota, network) is only reused for
+    GEMINI_RETRY_SECONDS, so a later call can recover.
+    """
+    with _gemini_lock:
+        cached = _gemini_instances.get(api_key)
+        if cached is not None:
+            gemini, built_at = cached
+            if gemini.available or time.monotonic() - built_at < GEMINI_RETRY_SECONDS:
+                return gemini
+        gemini = GeminiAI(api_key)
+        _gemini_instances[api_key] = (gemini, time.monotonic())
+        return gemini
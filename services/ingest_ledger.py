@@ -0,0 +1,62 @@
+# services/ingest_ledger.py
+import hashlib
+import sqlite3
+from contextlib import contextmanager
+
+class IngestLedger:
+    """Remembers which PDF contents have already been ingested into Qdrant"""
+
+    def __init__(self, db_path="ingested.sqlite3"):
+        self.db_path = db_path
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ingested ("
+                "hash TEXT PRIMARY KEY, path TEXT NOT NULL, mtime_ns INTEGER NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        # A short-lived connection per call keeps the ledger usable from any thread
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def file_hash(file_path, block_size=1 << 20):
+        """BLAKE2b digest of a file, streamed in 1 MiB blocks"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, "rb") as f:
+            while block := f.read(block_size):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def is_unchanged(self, file_path, mtime_ns):
+        """Cheap pre-check: was this exact path ingested with this mtime?"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM ingested WHERE path = ? AND mtime_ns = ?",
+                (file_path, mtime_ns),
+            ).fetchone()
+        return row is not None
+
+    def is_ingested(self, file_hash):
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM ingested WHERE hash = ?", (file_hash,)
+            ).fetchone()
+        return row is not None
+
+    def mark_ingested(self, file_hash, file_path, mtime_ns):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO ingested (hash, path, mtime_ns) VALUES (?, ?, ?)",
+                (file_hash, file_path, mtime_ns),
+            )
+
+    def reset(self):
+        """Forget everything, e.g. when the Qdrant collection was recreated"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM ingested")
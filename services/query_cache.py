@@ -0,0 +1,69 @@
+# services/query_cache.py
+import hashlib
+import json
+import threading
+import time
+
+import numpy as np
+from cachetools import TTLCache
+
+class QueryCache:
+    """LRU + TTL cache of vector search results, keyed by the query embedding"""
+
+    def __init__(self, maxsize=2000, ttl=600, timer=time.monotonic):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl, timer=timer)
+        self._lock = threading.RLock()
+        # Bumped by invalidate(); a result computed across an invalidation is stale
+        self._generations = {}
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _generation(self, collection):
+        return (self._epoch, self._generations.get(collection, 0))
+
+    @staticmethod
+    def make_key(collection, query_vector, top_k, query_filter=None):
+        """Build a cache key; the vector is rounded so near-identical queries share it"""
+        vector_bytes = np.round(np.asarray(query_vector, dtype=np.float32), 4).tobytes()
+        filter_hash = None
+        if query_filter is not None:
+            filter_hash = hashlib.blake2b(
+                json.dumps(query_filter, sort_keys=True, default=str).encode(),
+                digest_size=8,
+            ).hexdigest()
+        return (collection, vector_bytes, top_k, filter_hash)
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._cache:
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+            generation = self._generation(key[0])
+
+        # Compute outside the lock so a slow search doesn't serialise other lookups
+        value = compute()
+        with self._lock:
+            if self._generation(key[0]) == generation:
+                self._cache[key] = value
+        return value
+
+    def invalidate(self, collection=None):
+        """Drop cached results for one collection, or everything"""
+        with self._lock:
+            if collection is None:
+                self._epoch += 1
+                self._cache.clear()
+                return
+            self._generations[collection] = self._generations.get(collection, 0) + 1
+            for key in [k for k in self._cache.keys() if k[0] == collection]:
+                self._cache.pop(key, None)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+# Singleton instance
+query_cache = QueryCache()
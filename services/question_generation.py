@@ -5,11 +5,11 @@ from typing import List, Dict, Any
 
 try:
     # FIX: Use absolute import for services
-    from services.gemini_integration import GeminiAI
+    from services.gemini_integration import GeminiAI, get_gemini_ai
 except ImportError:
     try:
         # Fallback: try relative import
-        from .gemini_integration import GeminiAI
+        from .gemini_integration import GeminiAI, get_gemini_ai
     except ImportError:
         print("❌ Failed to import GeminiAI, using fallback")
         
@@ -313,10 +313,13 @@ except ImportError:
                     })
                 return base
 
+        def get_gemini_ai(api_key=None):
+            return GeminiAI(api_key)
+
 class QuestionGenerator:
     def __init__(self, api_key=None):
         print("🔄 Initializing QuestionGenerator...")
-        self.gemini = GeminiAI(api_key)
+        self.gemini = get_gemini_ai(api_key)
         print(f"🤖 QuestionGenerator ready - Gemini available: {getattr(self.gemini, 'available', False)}")
         # Track used questions to avoid duplicates in fallback mode
         self.used_questions = set()
@@ -1,6 +1,8 @@
 # streamlit_test.py
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import io
 import base64
@@ -9,6 +11,17 @@ from typing import Dict, Any
 # FastAPI backend URL
 BASE_URL = "http://localhost:8001"  # Change if your backend runs on different port
 
+@st.cache_resource
+def get_session():
+    """Shared HTTP session so reruns reuse keep-alive connections to the backend"""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    ))
+    return session
+
 def main():
     st.set_page_config(page_title="Exam Generator Test", page_icon="📝", layout="wide")
     
@@ -20,6 +33,8 @@ def main():
         st.header("API Status")
         if st.button("Check API Status"):
             check_api_status()
+        if st.button("Check Ingestion Status"):
+            check_ingest_status()
     
     # Main content
     tab1, tab2, tab3, tab4 = st.tabs([
@@ -44,7 +59,7 @@ def main():
 def check_api_status():
     """Check if FastAPI backend is running"""
     try:
-        response = requests.get(f"{BASE_URL}/")
+        response = get_session().get(f"{BASE_URL}/")
         if response.status_code == 200:
             st.sidebar.success("✅ Backend is running!")
         else:
@@ -52,6 +67,22 @@ def check_api_status():
     except requests.exceptions.ConnectionError:
         st.sidebar.error("❌ Cannot connect to backend. Make sure it's running on port 8000")
 
+def check_ingest_status():
+    """Check progress of the backend's startup PDF ingestion"""
+    try:
+        response = get_session().get(f"{BASE_URL}/ingest/status")
+        if response.status_code == 200:
+            status = response.json()
+            st.sidebar.write(f"**Ingestion:** {status.get('state')}")
+            if status.get("total"):
+                processed = sum(status.get(key, 0) for key in ("done", "skipped", "failed"))
+                st.sidebar.progress(processed / status["total"])
+            st.sidebar.json(status)
+        else:
+            st.sidebar.error(f"❌ Ingestion status returned: {response.status_code}")
+    except requests.exceptions.ConnectionError:
+        st.sidebar.error("❌ Cannot connect to backend")
+
 def test_paper_generation():
     """Test the paper generation endpoint"""
     st.header("📄 Generate Exam Paper")
@@ -112,7 +143,10 @@ def generate_paper(paper_heading, total_marks, include_roll, include_name, inclu
             # Prepare files and form data
             files = []
             for uploaded_file in uploaded_files:
-                files.append(("files", (uploaded_file.name, uploaded_file.getvalue(), "application/pdf")))
+                # Pass the file object itself rather than getvalue(), which made an
+                # extra copy; requests still builds the multipart body in memory
+                uploaded_file.seek(0)
+                files.append(("files", (uploaded_file.name, uploaded_file, "application/pdf")))
             
             data = {
                 "paperHeading": paper_heading,
@@ -129,7 +163,7 @@ def generate_paper(paper_heading, total_marks, include_roll, include_name, inclu
             }
             
             # Make API call
-            response = requests.post(
+            response = get_session().post(
                 f"{BASE_URL}/api/generate-paper",
                 files=files,
                 data=data
@@ -170,7 +204,7 @@ def display_generation_results(result):
     
     # Show latest paper
     try:
-        paper_response = requests.get(f"{BASE_URL}/api/latest-paper")
+        paper_response = get_session().get(f"{BASE_URL}/api/latest-paper")
         if paper_response.status_code == 200:
             latest_paper = paper_response.json()
             
@@ -188,12 +222,12 @@ def download_generated_paper():
     """Download the generated paper as PDF"""
     try:
         # Get latest paper data
-        paper_response = requests.get(f"{BASE_URL}/api/latest-paper")
+        paper_response = get_session().get(f"{BASE_URL}/api/latest-paper")
         if paper_response.status_code == 200:
             paper_data = paper_response.json()
             
             # Call download endpoint
-            download_response = requests.post(
+            download_response = get_session().post(
                 f"{BASE_URL}/api/download-paper",
                 json=paper_data
             )
@@ -212,60 +246,41 @@ def download_generated_paper():
         st.error(f"❌ Error downloading paper: {str(e)}")
 
 def test_service_status():
-    """Test various service status endpoints"""
+    """Show exam, Gemini and system status from one backend call"""
     st.header("📊 Service Status")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("Check Exam Service"):
-            check_exam_service()
-    
-    with col2:
-        if st.button("Check Gemini Status"):
-            check_gemini_status()
-    
-    with col3:
-        if st.button("System Health"):
-            check_system_health()
 
-def check_exam_service():
-    """Check exam service status"""
+    if st.button("Refresh Status"):
+        fetch_full_health.clear()
+
     try:
-        response = requests.get(f"{BASE_URL}/api/exam-service-status")
-        if response.status_code == 200:
-            status_data = response.json()
-            st.write("**Exam Service Status:**")
-            st.json(status_data)
-        else:
-            st.error(f"Failed to get status: {response.status_code}")
+        status = fetch_full_health()
+    except requests.exceptions.ConnectionError:
+        st.error("❌ Cannot connect to backend")
+        return
     except Exception as e:
-        st.error(f"Error checking exam service: {str(e)}")
+        st.error(f"Error checking service status: {str(e)}")
+        return
 
-def check_gemini_status():
-    """Check Gemini AI status"""
-    try:
-        # You might need to create this endpoint in your FastAPI
-        response = requests.get(f"{BASE_URL}/api/gemini-status")
-        if response.status_code == 200:
-            st.write("**Gemini AI Status:**")
-            st.json(response.json())
-        else:
-            st.info("Gemini status endpoint not available")
-    except:
-        st.info("Gemini status check not implemented")
+    col1, col2, col3 = st.columns(3)
 
-def check_system_health():
-    """Check overall system health"""
-    try:
-        # Test basic connectivity
-        response = requests.get(f"{BASE_URL}/")
-        if response.status_code == 200:
-            st.success("✅ Backend server is running")
-        else:
-            st.error("❌ Backend server issues")
-    except:
-        st.error("❌ Cannot connect to backend")
+    with col1:
+        st.write("**Exam Service Status:**")
+        st.json(status.get("exam", {}))
+
+    with col2:
+        st.write("**Gemini AI Status:**")
+        st.json(status.get("gemini", {}))
+
+    with col3:
+        st.write("**System Health:**")
+        st.json(status.get("system", {}))
+
+@st.cache_data(ttl=5)
+def fetch_full_health():
+    """Fetch /health/full; cached briefly so reruns don't re-hit the backend"""
+    response = get_session().get(f"{BASE_URL}/health/full")
+    response.raise_for_status()
+    return response.json()
 
 def test_other_endpoints():
     """Test other API endpoints"""
@@ -294,7 +309,7 @@ def test_pdf_upload():
 def test_question_generation():
     """Test direct question generation"""
     try:
-        response = requests.post(f"{BASE_URL}/api/test-exam-generation")
+        response = get_session().post(f"{BASE_URL}/api/test-exam-generation")
         if response.status_code == 200:
             result = response.json()
             st.write("**Test Generation Results:**")
@@ -307,7 +322,7 @@ def test_question_generation():
 def list_endpoints():
     """List available API endpoints"""
     try:
-        response = requests.get(f"{BASE_URL}/")
+        response = get_session().get(f"{BASE_URL}/")
         st.write("**Available Endpoints:**")
         st.code(response.text)
     except Exception as e:
@@ -326,7 +341,7 @@ def view_saved_papers():
     st.header("📋 Saved Papers")
     
     try:
-        response = requests.get(f"{BASE_URL}/api/saved-papers")
+        response = get_session().get(f"{BASE_URL}/api/saved-papers")
         if response.status_code == 200:
             papers = response.json()
             
@@ -359,7 +374,7 @@ def view_saved_papers():
 def delete_paper(paper_id):
     """Delete a paper"""
     try:
-        response = requests.delete(f"{BASE_URL}/api/paper/{paper_id}")
+        response = get_session().delete(f"{BASE_URL}/api/paper/{paper_id}")
         if response.status_code == 200:
             st.success("✅ Paper deleted successfully")
             st.rerun()
@@ -0,0 +1,38 @@
+import pytest
+
+import qdrant.indexer as indexer
+
+class RecordingClient:
+    def __init__(self):
+        self.calls = []
+
+    def upsert(self, collection_name, points, wait):
+        self.calls.append((points, wait))
+
+@pytest.fixture
+def client(monkeypatch):
+    client = RecordingClient()
+    monkeypatch.setattr(indexer, "get_client", lambda: client)
+    return client
+
+@pytest.mark.parametrize("count, expected", [
+    (512, [(512, True)]),
+    (1024, [(512, False), (512, True)]),
+    (513, [(512, False), (1, True)]),
+])
+def test_only_the_last_batch_waits(client, count, expected):
+    indexer.upsert_chunks([f"c{i}" for i in range(count)], [[0.0]] * count)
+
+    assert [(len(points), wait) for points, wait in client.calls] == expected
+
+def test_wait_false_never_waits(client):
+    indexer.upsert_chunks(["c"] * 1024, [[0.0]] * 1024, wait=False)
+
+    assert [wait for _, wait in client.calls] == [False, False]
+
+def test_chunk_ids_continue_across_batches_and_parts(client):
+    indexer.upsert_chunks([f"c{i}" for i in range(600)], [[0.0]] * 600, start=100)
+
+    payloads = [point.payload for points, _ in client.calls for point in points]
+    assert [p["chunk_id"] for p in payloads] == list(range(100, 700))
+    assert [p["chunk_text"] for p in payloads] == [f"c{i}" for i in range(600)]
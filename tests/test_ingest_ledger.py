@@ -0,0 +1,33 @@
+from services.ingest_ledger import IngestLedger
+
+def test_file_hash_depends_only_on_content(tmp_path):
+    a = tmp_path / "a.pdf"
+    b = tmp_path / "b.pdf"
+    a.write_bytes(b"same bytes")
+    b.write_bytes(b"same bytes")
+
+    assert IngestLedger.file_hash(a) == IngestLedger.file_hash(b)
+    b.write_bytes(b"other bytes")
+    assert IngestLedger.file_hash(a) != IngestLedger.file_hash(b)
+
+def test_mark_ingested_and_lookups(tmp_path):
+    ledger = IngestLedger(tmp_path / "ledger.sqlite3")
+    pdf = str(tmp_path / "a.pdf")
+
+    assert not ledger.is_ingested("abc")
+    assert not ledger.is_unchanged(pdf, 100)
+
+    ledger.mark_ingested("abc", pdf, 100)
+    assert ledger.is_ingested("abc")
+    assert ledger.is_unchanged(pdf, 100)
+    assert not ledger.is_unchanged(pdf, 200)
+
+def test_ledger_persists_and_resets(tmp_path):
+    db_path = tmp_path / "ledger.sqlite3"
+    IngestLedger(db_path).mark_ingested("abc", "a.pdf", 100)
+
+    ledger = IngestLedger(db_path)
+    assert ledger.is_ingested("abc")
+
+    ledger.reset()
+    assert not ledger.is_ingested("abc")
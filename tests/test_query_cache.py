@@ -0,0 +1,63 @@
+from services.query_cache import QueryCache
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_make_key_rounds_vector_and_separates_arguments():
+    key = QueryCache.make_key("docs", [0.1, 0.2], 5)
+
+    assert key == QueryCache.make_key("docs", [0.100001, 0.2], 5)
+    assert key != QueryCache.make_key("other", [0.1, 0.2], 5)
+    assert key != QueryCache.make_key("docs", [0.1, 0.2], 10)
+    assert key != QueryCache.make_key("docs", [0.1, 0.2], 5, {"doc_id": "a"})
+    assert (QueryCache.make_key("docs", [0.1], 5, {"a": 1, "b": 2})
+            == QueryCache.make_key("docs", [0.1], 5, {"b": 2, "a": 1}))
+
+def test_get_or_compute_caches_and_tracks_hit_rate():
+    cache = QueryCache()
+    key = QueryCache.make_key("docs", [0.1, 0.2], 5)
+    calls = []
+
+    assert cache.hit_rate == 0.0
+    assert cache.get_or_compute(key, lambda: calls.append(1) or "result") == "result"
+    assert cache.get_or_compute(key, lambda: calls.append(1) or "other") == "result"
+    assert len(calls) == 1
+    assert cache.hit_rate == 0.5
+
+def test_entries_expire_after_ttl():
+    timer = FakeTimer()
+    cache = QueryCache(ttl=10, timer=timer)
+    key = QueryCache.make_key("docs", [0.1], 5)
+
+    cache.get_or_compute(key, lambda: "old")
+    timer.now = 11
+    assert cache.get_or_compute(key, lambda: "new") == "new"
+
+def test_invalidate_drops_only_that_collection():
+    cache = QueryCache()
+    docs = QueryCache.make_key("docs", [0.1], 5)
+    other = QueryCache.make_key("other", [0.1], 5)
+    cache.get_or_compute(docs, lambda: "docs")
+    cache.get_or_compute(other, lambda: "other")
+
+    cache.invalidate("docs")
+    assert cache.get_or_compute(docs, lambda: "fresh") == "fresh"
+    assert cache.get_or_compute(other, lambda: "stale") == "other"
+
+    cache.invalidate()
+    assert cache.get_or_compute(other, lambda: "fresh") == "fresh"
+
+def test_result_computed_across_invalidate_is_not_stored():
+    cache = QueryCache()
+    key = QueryCache.make_key("docs", [0.1], 5)
+
+    def search_during_reindex():
+        cache.invalidate("docs")
+        return "stale"
+
+    assert cache.get_or_compute(key, search_during_reindex) == "stale"
+    assert cache.get_or_compute(key, lambda: "fresh") == "fresh"
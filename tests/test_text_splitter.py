@@ -0,0 +1,30 @@
+from services.data_ingestion import RecursiveCharacterTextSplitter
+
+# Each "Heading N. " is followed by a run with no sentence break, so the only
+# ". " in a window sits right at its start. This used to loop forever, and later
+# produced one chunk per character of the overlap.
+WORDS = " ".join(f"word{i}" for i in range(120))
+TEXT = " ".join(f"Heading {i}. {WORDS}" for i in range(5))
+
+def test_split_text_terminates_and_covers_text():
+    splitter = RecursiveCharacterTextSplitter(chunk_size=512, chunk_overlap=64)
+    chunks = splitter.split_text(TEXT)
+
+    assert chunks[0].startswith("Heading 0. ")
+    assert chunks[-1].endswith("word119")
+    for i in range(5):
+        assert any(f"Heading {i}." in chunk for chunk in chunks)
+
+def test_split_text_has_no_shifted_duplicate_chunks():
+    splitter = RecursiveCharacterTextSplitter(chunk_size=512, chunk_overlap=64)
+    chunks = splitter.split_text(TEXT)
+
+    for previous, current in zip(chunks, chunks[1:]):
+        assert not previous.endswith(current)
+    assert len(chunks) <= len(TEXT) // (512 - 64) + 2
+
+def test_split_text_overlap_not_smaller_than_chunk_size():
+    splitter = RecursiveCharacterTextSplitter(chunk_size=50, chunk_overlap=50)
+    chunks = splitter.split_text(TEXT[:500])
+
+    assert "".join(chunks).replace(" ", "") == TEXT[:500].replace(" ", "")